@@ -48,6 +48,9 @@ ELM_INSTANCES_TSV_DOWNLOAD = (
 ELM_CLASSES_TSV_DOWNLOAD = "http://elm.eu.org/elms/elms_index.tsv"
 ELM_INTDOMAINS_TSV_DOWNLOAD = "http://elm.eu.org/interactiondomains.tsv"
 
+# ColabFold MMseqs2 API server for gget alphafold
+MMSEQS2_API = "https://api.colabfold.com"
+
 # COSMIC API endpoint
 COSMIC_GET_URL = "https://cancer.sanger.ac.uk/cosmic/search/"
 COSMIC_RELEASE_URL = "https://cancer.sanger.ac.uk/cosmic/release_notes"
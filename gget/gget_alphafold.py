@@ -11,29 +11,32 @@ from datetime import datetime
 # Get current date and time for default foldername
 dt_string = datetime.now().strftime("%Y_%m_%d-%H%M")
 
-from tqdm import tqdm
 import os
 import shutil
 import sys
 import enum
 import glob
 import json
-import subprocess
 import platform
 import collections
-import copy
+import hashlib
+import pickle
+import tempfile
+import threading
 from concurrent import futures
+from importlib import metadata
 import random
 from urllib import request
-import matplotlib.pyplot as plt
 import numpy as np
-from IPython import display
-from ipywidgets import GridspecLayout
-from ipywidgets import Output
 
-from .utils import set_up_logger
+# The plotting/notebook dependencies (matplotlib, IPython, ipywidgets, tqdm, py3Dmol)
+# are imported inside the functions that use them so 'import gget' stays fast
+
+from .utils import read_fasta, set_up_logger
 logger = set_up_logger()
 
+from .msa_mmseqs import run_mmseqs2, parse_a3m
+
 TQDM_BAR_FORMAT = (
     "{l_bar}{bar}| {n_fmt}/{total_fmt} [elapsed: {elapsed} remaining: {remaining}]"
 )
@@ -44,6 +47,8 @@ from .compile import PACKAGE_PATH
 from .gget_setup import UUID, PARAMS_DIR
 
 STEREO_CHEM_DIR = os.path.join(PARAMS_DIR, "stereo_chemical_props.txt")
+# Folder to cache MSA results in between gget alphafold runs
+MSA_CACHE_DIR = os.path.join(PARAMS_DIR, "msa_cache")
 # Path to jackhmmer binary
 JACKHMMER_BINARY_PATH = os.path.join(
     PACKAGE_PATH, f"bins/{platform.system()}/jackhmmer"
@@ -69,6 +74,12 @@ MAX_HITS = {
     "uniprot": 50_000,
 }
 
+# Cache of compiled AlphaFold model runners, keyed by
+# (model name, model type, multimer recycle limit). Reusing a runner across
+# alphafold() calls in the same session lets JAX reuse its compiled kernels
+# instead of re-JITting the model graph for every prediction.
+model_runner_cache = {}
+
 # Color bands for visualizing plddt
 PLDDT_BANDS = [
     (0, 50, "#FF7D45"),
@@ -76,12 +87,18 @@ PLDDT_BANDS = [
     (70, 90, "#65CBF3"),
     (90, 100, "#0053D6"),
 ]
+# Upper band edges (for vectorized band assignment) and band index -> color
+# lookup, derived once from PLDDT_BANDS
+PLDDT_BAND_EDGES = np.array([max_val for _, max_val, _ in PLDDT_BANDS[:-1]])
+PLDDT_COLOR_MAP = {i: bands[2] for i, bands in enumerate(PLDDT_BANDS)}
 
 
 def plot_plddt_legend():
     """
     Function to plot the legend for pLDDT.
     """
+    import matplotlib.pyplot as plt
+
     thresh = [
         "Very low (pLDDT < 50)",
         "Low (70 > pLDDT > 50)",
@@ -110,15 +127,25 @@ def plot_plddt_legend():
 def fetch(source):
     """
     Support function for finding closest source.
+    Requests a single byte from the test URL instead of downloading the
+    whole chunk - the latency race is all that matters here.
     """
-    request.urlretrieve(test_url_pattern.format(source))
+    req = request.Request(
+        test_url_pattern.format(source), headers={"Range": "bytes=0-0"}
+    )
+    with request.urlopen(req) as response:
+        response.read()
     return source
 
 
-def get_msa(fasta_path, msa_databases, total_jackhmmer_chunks):
+def get_msa(fasta_path, msa_databases, total_jackhmmer_chunks, num_msa_workers=1):
     """
     Function to search for MSA for the given sequence using chunked Jackhmmer search.
+    When num_msa_workers > 1, the chunk range of each database is sharded across
+    that many parallel Jackhmmer searches (in addition to the databases themselves
+    being searched concurrently).
     """
+    from tqdm import tqdm
     from alphafold.data.tools import jackhmmer
 
     ## Run the search against chunks of genetic databases to save disk space
@@ -128,12 +155,15 @@ def get_msa(fasta_path, msa_databases, total_jackhmmer_chunks):
         # Set progress bar description
         pbar.set_description("Jackhmmer search")
 
-        def jackhmmer_chunk_callback(i):
-            pbar.update(n=1)
+        # The searches against the individual databases are independent, network-
+        # and subprocess-bound workloads, so they are run concurrently
+        pbar_lock = threading.Lock()
 
-        for db_config in msa_databases:
-            db_name = db_config["db_name"]
+        def jackhmmer_chunk_callback(i):
+            with pbar_lock:
+                pbar.update(n=1)
 
+        def run_db(db_config):
             jackhmmer_runner = jackhmmer.Jackhmmer(
                 binary_path=JACKHMMER_BINARY_PATH,
                 database_path=db_config["db_path"],
@@ -142,12 +172,138 @@ def get_msa(fasta_path, msa_databases, total_jackhmmer_chunks):
                 streaming_callback=jackhmmer_chunk_callback,
                 z_value=db_config["z_value"],
             )
-            # Group the results by database name.
-            raw_msa_results[db_name].extend(jackhmmer_runner.query(fasta_path))
+            return db_config["db_name"], jackhmmer_runner.query(fasta_path)
+
+        def run_db_shard(db_config, chunk_indices):
+            # Stream and search a disjoint subrange of one database's chunks,
+            # returning (chunk index, result) pairs so the shards can be
+            # stitched back together in chunk order
+            shard_dir = tempfile.mkdtemp(dir=setup_jackhmmer_chunk_dir())
+            db_basename = os.path.basename(db_config["db_path"])
+            chunk_results = []
+            try:
+                for i in chunk_indices:
+                    local_chunk = os.path.join(shard_dir, f"{db_basename}.{i}")
+                    request.urlretrieve(f"{db_config['db_path']}.{i}", local_chunk)
+                    jackhmmer_runner = jackhmmer.Jackhmmer(
+                        binary_path=JACKHMMER_BINARY_PATH,
+                        database_path=local_chunk,
+                        get_tblout=True,
+                        z_value=db_config["z_value"],
+                    )
+                    chunk_results.append((i, jackhmmer_runner.query(fasta_path)[0]))
+                    os.remove(local_chunk)
+                    jackhmmer_chunk_callback(i)
+            finally:
+                shutil.rmtree(shard_dir, ignore_errors=True)
+            return db_config["db_name"], chunk_results
+
+        if num_msa_workers > 1:
+            # Shard each database's chunk range across the workers
+            shard_tasks = []
+            for db_config in msa_databases:
+                num_chunks = db_config["num_streamed_chunks"]
+                num_shards = min(num_msa_workers, num_chunks)
+                for shard in range(num_shards):
+                    chunk_indices = list(range(1 + shard, num_chunks + 1, num_shards))
+                    shard_tasks.append((db_config, chunk_indices))
+
+            with futures.ThreadPoolExecutor(max_workers=num_msa_workers) as ex:
+                fs = [
+                    ex.submit(run_db_shard, db_config, chunk_indices)
+                    for db_config, chunk_indices in shard_tasks
+                ]
+                chunk_results_by_db = collections.defaultdict(list)
+                for f in futures.as_completed(fs):
+                    db_name, chunk_results = f.result()
+                    chunk_results_by_db[db_name].extend(chunk_results)
+
+            # Restore the original chunk order so the merged MSA is
+            # identical to that of a sequential search
+            for db_name, chunk_results in chunk_results_by_db.items():
+                raw_msa_results[db_name] = [
+                    result for _, result in sorted(chunk_results, key=lambda x: x[0])
+                ]
+        else:
+            with futures.ThreadPoolExecutor(max_workers=len(msa_databases)) as ex:
+                fs = [ex.submit(run_db, db_config) for db_config in msa_databases]
+                for f in futures.as_completed(fs):
+                    # Group the results by database name.
+                    db_name, db_results = f.result()
+                    raw_msa_results[db_name].extend(db_results)
 
     return raw_msa_results
 
 
+def msa_cache_path(sequence, msa_backend="jackhmmer"):
+    """
+    Support function returning the MSA cache file path for a given amino acid sequence.
+    """
+    key = hashlib.sha256(sequence.encode()).hexdigest()
+    return os.path.join(MSA_CACHE_DIR, f"{key}_{msa_backend}.pkl")
+
+
+def load_msa_from_cache(sequence, msa_backend="jackhmmer"):
+    """
+    Function to load previously computed raw MSA results for a sequence from the on-disk cache.
+    Returns None if the sequence is not cached.
+    """
+    cache_path = msa_cache_path(sequence, msa_backend)
+    if not os.path.exists(cache_path):
+        return None
+
+    try:
+        with open(cache_path, "rb") as f:
+            return pickle.load(f)
+    except Exception:
+        # Treat unreadable/corrupt cache files as a cache miss
+        return None
+
+
+def save_msa_to_cache(sequence, raw_msa_results, msa_backend="jackhmmer"):
+    """
+    Function to save raw MSA results for a sequence to the on-disk cache.
+    """
+    os.makedirs(MSA_CACHE_DIR, exist_ok=True)
+
+    # Write to a temporary file first so a crashed run never leaves a partial cache entry
+    fd, tmp_path = tempfile.mkstemp(dir=MSA_CACHE_DIR, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(raw_msa_results, f)
+        os.replace(tmp_path, msa_cache_path(sequence, msa_backend))
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def setup_jackhmmer_chunk_dir():
+    """
+    Function to create the temporary folder Jackhmmer database chunks are streamed into.
+    On Linux, the folder is placed on the /dev/shm tmpfs (when it has at least 10 GB free)
+    so the multi-GB chunk I/O is served from RAM instead of disk.
+    """
+    chunk_dir = os.path.expanduser(f"~/tmp/jackhmmer/{UUID}")
+    if os.path.exists(chunk_dir):
+        return chunk_dir
+
+    # Skip for macOS (mounting a RAM disk requires hdiutil) and Windows
+    if platform.system() == "Linux" and os.path.isdir("/dev/shm"):
+        try:
+            if shutil.disk_usage("/dev/shm").free > 10 * 1024**3:
+                ramdisk_dir = os.path.join("/dev/shm", f"gget_jackhmmer_{UUID}")
+                os.makedirs(ramdisk_dir, exist_ok=True)
+                os.makedirs(os.path.dirname(chunk_dir), exist_ok=True)
+                os.symlink(ramdisk_dir, chunk_dir)
+                return chunk_dir
+        except OSError:
+            # Fall back to a regular on-disk folder below
+            pass
+
+    os.makedirs(chunk_dir, exist_ok=True)
+    return chunk_dir
+
+
 def clean_up():
     """
     Function to clean up temporary files after running gget alphafold.
@@ -177,12 +333,24 @@ def clean_up():
     #           sys.stderr.write(stderr)
 
     # Delete any fasta files left in temporary jackhmmer folder
-    for file in glob.glob(os.path.expanduser(f"~/tmp/jackhmmer/{UUID}/*.fasta")):
+    chunk_dir = os.path.expanduser(f"~/tmp/jackhmmer/{UUID}")
+    for file in glob.glob(f"{chunk_dir}/*.fasta"):
         if os.path.exists(file):
             os.remove(file)
 
-    # Delete empty parent folders
-    os.removedirs(os.path.expanduser(f"~/tmp/jackhmmer/{UUID}"))
+    if os.path.islink(chunk_dir):
+        # The chunk folder was a symlink into the /dev/shm ramdisk
+        # -> free the RAM by removing the ramdisk folder and the link
+        ramdisk_dir = os.path.realpath(chunk_dir)
+        os.remove(chunk_dir)
+        shutil.rmtree(ramdisk_dir, ignore_errors=True)
+        try:
+            os.removedirs(os.path.dirname(chunk_dir))
+        except OSError:
+            pass
+    else:
+        # Delete empty parent folders
+        os.removedirs(chunk_dir)
 
 
 def alphafold(
@@ -191,6 +359,9 @@ def alphafold(
     multimer_for_monomer=False,
     relax=False,
     multimer_recycles=3,
+    msa_backend="jackhmmer",
+    msa_cache=True,
+    num_msa_workers=1,
     plot=True,
     show_sidechains=True,
     verbose=True,
@@ -207,6 +378,16 @@ def alphafold(
       - multimer_recycles       The multimer model will continue recycling until the predictions stop changing, up to the limit set here (default: 3).
                                 For higher accuracy, at the potential cost of longer inference times, set this to 20.
       - relax                   True/False whether to AMBER relax the best model (default: False).
+      - msa_backend             'jackhmmer' (default) to search the genetic databases with chunked Jackhmmer,
+                                or 'mmseqs2' to query the remote ColabFold MMseqs2 server instead (usually much faster).
+                                If you use the 'mmseqs2' backend, please also cite the ColabFold paper
+                                (https://doi.org/10.1038/s41592-022-00539-7).
+      - msa_cache               True/False whether to cache MSA results on disk so identical sequences
+                                skip the MSA search in later calls (default: True).
+      - num_msa_workers         Number of parallel Jackhmmer searches to shard each database's chunks
+                                across (default: 1). Higher values speed up the MSA search on machines
+                                with enough CPU cores and network bandwidth. Only applies to the
+                                'jackhmmer' MSA backend.
       - plot                    True/False whether to provide a graphical overview of the prediction (default: True).
       - show_sidechains         True/False whether to show side chains in the plot (default: True).
       - verbose                 True/False whether to print progress information. Default True.
@@ -234,6 +415,12 @@ def alphafold(
             "gget setup alphafold and gget alphafold are not supported on Windows OS."
         )
 
+    supported_msa_backends = ["jackhmmer", "mmseqs2"]
+    if msa_backend not in supported_msa_backends:
+        raise ValueError(
+            f"'msa_backend' argument specified as {msa_backend}. Expected one of: {', '.join(supported_msa_backends)}"
+        )
+
     ## Check if third-party dependencies are installed
     # Check if openmm is installed
     try:
@@ -263,14 +450,13 @@ def alphafold(
         return
 
     # Check if pdbfixer is installed
-    command = "pip list | grep pdbfixer"
-    process = subprocess.Popen(command, shell=True, stdout=subprocess.PIPE)
-    pdb_out, err = process.communicate()
-
-    if pdb_out.decode() == "":
+    # (in-process metadata lookup instead of spawning pip list | grep)
+    try:
+        metadata.version("pdbfixer")
+    except metadata.PackageNotFoundError:
         logger.error(
             """
-            Some third-party dependencies are missing. Please run the following command: 
+            Some third-party dependencies are missing. Please run the following command:
             >>> gget.setup('alphafold') or $ gget setup alphafold
             """
         )
@@ -303,6 +489,7 @@ def alphafold(
 
     from alphafold.data import feature_processing
     from alphafold.data import msa_pairing
+    from alphafold.data import parsers
     from alphafold.data import pipeline
     from alphafold.data import pipeline_multimer
 
@@ -343,11 +530,10 @@ def alphafold(
     ## Move stereo_chemical_props.txt from gget bins to Alphafold package so it can be found
     # logger.info("Locate files containing stereochemical properties.")
     ALPHAFOLD_PATH = os.path.abspath(os.path.dirname(AlphaFold.__file__))
-    os.makedirs(os.path.join(ALPHAFOLD_PATH, "common/"), exist_ok=True)
-    shutil.copyfile(
-        STEREO_CHEM_DIR,
-        os.path.join(ALPHAFOLD_PATH, "common/stereo_chemical_props.txt"),
-    )
+    stereo_chem_dst = os.path.join(ALPHAFOLD_PATH, "common/stereo_chemical_props.txt")
+    if not os.path.exists(stereo_chem_dst):
+        os.makedirs(os.path.join(ALPHAFOLD_PATH, "common/"), exist_ok=True)
+        shutil.copyfile(STEREO_CHEM_DIR, stereo_chem_dst)
 
     ## Validate input sequence(s)
     if verbose:
@@ -358,44 +544,20 @@ def alphafold(
         sequence = sequence[0]
 
     # If the path to a fasta file was provided instead of a nucleotide sequence,
-    # read the file and extract the first sequence
+    # read the file and extract the sequences
     if "." in sequence:
-        if ".txt" in sequence:
-            # Read the text file
-            titles = []
-            seqs = []
-            with open(sequence) as text_file:
-                for i, line in enumerate(text_file):
-                    # Recognize a title line by the '>' character
-                    if line[0] == ">":
-                        # Append title line to titles list
-                        titles.append(line.strip())
-                    else:
-                        seqs.append(line.strip())
-
-        elif ".fa" in sequence:
-            # Read the FASTA
-            titles = []
-            seqs = []
-            with open(sequence) as fasta_file:
-                for i, line in enumerate(fasta_file):
-                    # Each second line will be a title line
-                    if i % 2 == 0:
-                        if line[0] != ">":
-                            raise ValueError(
-                                "Expected FASTA to start with a '>' character. "
-                            )
-                        else:
-                            # Append title line to titles list
-                            titles.append(line.strip())
-                    else:
-                        if line[0] == ">":
-                            raise ValueError(
-                                "FASTA contains two lines starting with '>' in a row -> missing sequence line. "
-                            )
-                        # Append sequences line to seqs list
-                        else:
-                            seqs.append(line.strip())
+        if ".txt" in sequence or ".fa" in sequence:
+            with open(sequence) as seq_file:
+                first_line = seq_file.readline()
+
+            if first_line.startswith(">"):
+                # Parse the FASTA in a single pass
+                # (this also handles sequences wrapped over multiple lines)
+                titles, seqs = read_fasta(sequence)
+            else:
+                # Read a plain text file containing one sequence per line
+                with open(sequence) as seq_file:
+                    seqs = [line.strip() for line in seq_file if line.strip()]
         else:
             raise ValueError(
                 "File format not recognized. gget alphafold only supports '.txt' or '.fa' files. "
@@ -454,53 +616,56 @@ def alphafold(
             f"The accuracy of this algorithm has not been fully validated above 3000 residues, and you may experience long running times or run out of memory. Total sequence length is {total_sequence_length} residues."
         )
 
-    ## Find the closest source
-    if verbose:
-        logger.info(f"Finding closest source for reference database.")
-
-    ex = futures.ThreadPoolExecutor(3)
-    fs = [ex.submit(fetch, source) for source in ["", "-europe", "-asia"]]
-    source = None
-    for f in futures.as_completed(fs):
-        source = f.result()
-        ex.shutdown()
-        break
-
-    DB_ROOT_PATH = f"https://storage.googleapis.com/alphafold-colab{source}/latest/"
-    MSA_DATABASES = [
-        {
-            "db_name": "uniref90",
-            "db_path": f"{DB_ROOT_PATH}uniref90_2022_01.fasta",
-            "num_streamed_chunks": 62,
-            "z_value": 144_113_457,
-        },
-        {
-            "db_name": "smallbfd",
-            "db_path": f"{DB_ROOT_PATH}bfd-first_non_consensus_sequences.fasta",
-            "num_streamed_chunks": 17,
-            "z_value": 65_984_053,
-        },
-        {
-            "db_name": "mgnify",
-            "db_path": f"{DB_ROOT_PATH}mgy_clusters_2022_05.fasta",
-            "num_streamed_chunks": 120,
-            "z_value": 623_796_864,
-        },
-    ]
-
-    # Search UniProt and construct the all_seq features (only for heteromers, not homomers).
-    if model_type_to_use == ModelType.MULTIMER and len(set(sequences)) > 1:
-        MSA_DATABASES.extend(
-            [
-                # Swiss-Prot and TrEMBL are concatenated together as UniProt
-                {
-                    "db_name": "uniprot",
-                    "db_path": f"{DB_ROOT_PATH}uniprot_2021_04.fasta",
-                    "num_streamed_chunks": 101,
-                    "z_value": 225_013_025 + 565_928,
-                },
-            ]
-        )
+    MSA_DATABASES = []
+    if msa_backend == "jackhmmer":
+        ## Find the closest source
+        if verbose:
+            logger.info(f"Finding closest source for reference database.")
+
+        ex = futures.ThreadPoolExecutor(3)
+        fs = [ex.submit(fetch, source) for source in ["", "-europe", "-asia"]]
+        source = None
+        for f in futures.as_completed(fs):
+            source = f.result()
+            # Don't wait for the slower mirrors to answer
+            ex.shutdown(wait=False)
+            break
+
+        DB_ROOT_PATH = f"https://storage.googleapis.com/alphafold-colab{source}/latest/"
+        MSA_DATABASES = [
+            {
+                "db_name": "uniref90",
+                "db_path": f"{DB_ROOT_PATH}uniref90_2022_01.fasta",
+                "num_streamed_chunks": 62,
+                "z_value": 144_113_457,
+            },
+            {
+                "db_name": "smallbfd",
+                "db_path": f"{DB_ROOT_PATH}bfd-first_non_consensus_sequences.fasta",
+                "num_streamed_chunks": 17,
+                "z_value": 65_984_053,
+            },
+            {
+                "db_name": "mgnify",
+                "db_path": f"{DB_ROOT_PATH}mgy_clusters_2022_05.fasta",
+                "num_streamed_chunks": 120,
+                "z_value": 623_796_864,
+            },
+        ]
+
+        # Search UniProt and construct the all_seq features (only for heteromers, not homomers).
+        if model_type_to_use == ModelType.MULTIMER and len(set(sequences)) > 1:
+            MSA_DATABASES.extend(
+                [
+                    # Swiss-Prot and TrEMBL are concatenated together as UniProt
+                    {
+                        "db_name": "uniprot",
+                        "db_path": f"{DB_ROOT_PATH}uniprot_2021_04.fasta",
+                        "num_streamed_chunks": 101,
+                        "z_value": 225_013_025 + 565_928,
+                    },
+                ]
+            )
 
     TOTAL_JACKHMMER_CHUNKS = sum([cfg["num_streamed_chunks"] for cfg in MSA_DATABASES])
 
@@ -514,58 +679,144 @@ def alphafold(
         abs_out_path = os.path.expanduser(f"~/tmp/jackhmmer/{UUID}")
 
     # Create folder to save temporary jackhmmer database chunks in
-    os.makedirs(os.path.expanduser(f"~/tmp/jackhmmer/{UUID}"), exist_ok=True)
-
-    features_for_chain = {}
-    raw_msa_results_for_sequence = {}
-    for sequence_index, sequence in enumerate(sequences, start=1):
-        # logger.info(f"Getting MSA for sequence {sequence_index}.")
+    # (served from the /dev/shm ramdisk on Linux when possible)
+    setup_jackhmmer_chunk_dir()
 
+    if msa_backend == "jackhmmer":
         ## Manage permissions to jackhmmer binary
-        command = f"chmod 755 {JACKHMMER_BINARY_PATH}"
-        with subprocess.Popen(command, shell=True, stderr=subprocess.PIPE) as process:
-            stderr = process.stderr.read().decode("utf-8")
-        # Exit system if the subprocess returned with an error
-        if process.wait() != 0:
-            if stderr:
-                # Log the standard error if it is not empty
-                sys.stderr.write(stderr)
-            logger.error("Giving chmod 755 permissions to jackhmmer binary failed.")
+        # Check and fix the mode in-process (instead of spawning a chmod
+        # subprocess once per sequence), and only write it when it changed
+        try:
+            st = os.stat(JACKHMMER_BINARY_PATH)
+            if (st.st_mode & 0o755) != 0o755:
+                os.chmod(JACKHMMER_BINARY_PATH, st.st_mode | 0o755)
+        except OSError as e:
+            logger.error(
+                f"Giving chmod 755 permissions to jackhmmer binary failed: {e}"
+            )
             return
 
+    ## Compute the MSAs for all unique sequences first
+    # Multiple copies of the same chain in the multimer are only searched once.
+    # Only the mmseqs2 backend searches distinct chains concurrently: AlphaFold's
+    # jackhmmer pipeline streams its database chunks through one shared chunk
+    # folder (and deletes them as it goes), so concurrent jackhmmer queries
+    # would clobber each other's in-flight chunks
+    unique_sequences = list(dict.fromkeys(sequences))
+    if msa_backend == "mmseqs2":
+        num_sequence_workers = min(len(unique_sequences), 4)
+    else:
+        num_sequence_workers = 1
+
+    def compute_msa(sequence_index, sequence):
+        """
+        Support function returning the raw MSA results for a single sequence,
+        using the on-disk cache where possible.
+        """
         # Save the target sequence in a fasta file
         fasta_path = os.path.join(abs_out_path, f"target_{sequence_index}.fasta")
         with open(fasta_path, "wt") as f:
             f.write(f">query\n{sequence}")
 
-        # Don't do redundant work for multiple copies of the same chain in the multimer
-        if sequence not in raw_msa_results_for_sequence:
-            raw_msa_results = get_msa(
-                fasta_path=fasta_path,
-                msa_databases=MSA_DATABASES,
-                total_jackhmmer_chunks=TOTAL_JACKHMMER_CHUNKS,
+        raw_msa_results = None
+
+        # Check the on-disk cache for MSA results from previous runs
+        if msa_cache:
+            raw_msa_results = load_msa_from_cache(sequence, msa_backend)
+
+            # Ignore cache entries that are missing one of the required databases
+            # (e.g. entries written by a monomer run which did not search uniprot)
+            if raw_msa_results is not None and not all(
+                db_config["db_name"] in raw_msa_results
+                for db_config in MSA_DATABASES
+            ):
+                raw_msa_results = None
+
+            if raw_msa_results is not None and verbose:
+                logger.info(f"Using cached MSA results for sequence {sequence_index}.")
+
+        if raw_msa_results is None:
+            if msa_backend == "mmseqs2":
+                raw_msa_results = run_mmseqs2(sequence, verbose=verbose)
+            else:
+                raw_msa_results = get_msa(
+                    fasta_path=fasta_path,
+                    msa_databases=MSA_DATABASES,
+                    total_jackhmmer_chunks=TOTAL_JACKHMMER_CHUNKS,
+                    num_msa_workers=num_msa_workers,
+                )
+            if msa_cache:
+                save_msa_to_cache(sequence, raw_msa_results, msa_backend)
+
+        return sequence, raw_msa_results
+
+    raw_msa_results_for_sequence = {}
+    with futures.ThreadPoolExecutor(max_workers=num_sequence_workers) as ex:
+        fs = [
+            ex.submit(compute_msa, sequences.index(seq) + 1, seq)
+            for seq in unique_sequences
+        ]
+        for f in futures.as_completed(fs):
+            msa_sequence, raw_msa_results = f.result()
+            raw_msa_results_for_sequence[msa_sequence] = raw_msa_results
+
+    features_for_chain = {}
+    # Feature tensors built for each unique sequence, so repeated chains in a
+    # homomer don't rebuild the (large) MSA feature arrays from scratch
+    features_for_sequence = {}
+    for sequence_index, sequence in enumerate(sequences, start=1):
+        # Reuse the feature tensors built for an earlier identical chain
+        # (a shallow copy keeps the downstream per-chain processing independent)
+        if sequence in features_for_sequence:
+            if verbose:
+                logger.info(
+                    f"Reusing MSA features from an identical chain for sequence {sequence_index}."
+                )
+            features_for_chain[protein.PDB_CHAIN_IDS[sequence_index - 1]] = dict(
+                features_for_sequence[sequence]
             )
-            raw_msa_results_for_sequence[sequence] = raw_msa_results
-        else:
-            raw_msa_results = copy.deepcopy(raw_msa_results_for_sequence[sequence])
+            continue
+
+        raw_msa_results = raw_msa_results_for_sequence[sequence]
 
-        ## Extract the MSAs from the Stockholm files.
+        ## Extract the MSAs from the raw search results.
         # NB: deduplication happens later in pipeline.make_msa_features.
         single_chain_msas = []
         uniprot_msa = None
-        for db_name, db_results in raw_msa_results.items():
-            merged_msa = notebook_utils.merge_chunked_msa(
-                results=db_results, max_hits=MAX_HITS.get(db_name)
-            )
-            if merged_msa.sequences and db_name != "uniprot":
-                single_chain_msas.append(merged_msa)
-                msa_size = len(set(merged_msa.sequences))
+        if msa_backend == "mmseqs2":
+            # Parse the A3M alignments returned by the MMseqs2 server
+            for db_name, a3m_text in raw_msa_results.items():
+                msa_seqs, deletion_matrix, descriptions = parse_a3m(a3m_text)
+                if not msa_seqs:
+                    continue
+                msa = parsers.Msa(
+                    sequences=msa_seqs,
+                    deletion_matrix=deletion_matrix,
+                    descriptions=descriptions,
+                )
+                single_chain_msas.append(msa)
                 if verbose:
+                    msa_size = len(set(msa_seqs))
                     logger.info(
                         f"{msa_size} unique sequences found in {db_name} for sequence {sequence_index}."
                     )
-            elif merged_msa.sequences and db_name == "uniprot":
-                uniprot_msa = merged_msa
+            # The MMseqs2 server does not serve UniProt separately; reuse the first
+            # (UniRef-based) alignment to construct the all_seq features for chain pairing
+            uniprot_msa = single_chain_msas[0]
+        else:
+            for db_name, db_results in raw_msa_results.items():
+                merged_msa = notebook_utils.merge_chunked_msa(
+                    results=db_results, max_hits=MAX_HITS.get(db_name)
+                )
+                if merged_msa.sequences and db_name != "uniprot":
+                    single_chain_msas.append(merged_msa)
+                    if verbose:
+                        msa_size = len(set(merged_msa.sequences))
+                        logger.info(
+                            f"{msa_size} unique sequences found in {db_name} for sequence {sequence_index}."
+                        )
+                elif merged_msa.sequences and db_name == "uniprot":
+                    uniprot_msa = merged_msa
 
         notebook_utils.show_msa_info(
             single_chain_msas=single_chain_msas, sequence_index=sequence_index
@@ -596,6 +847,7 @@ def alphafold(
             }
             feature_dict.update(all_seq_features)
 
+        features_for_sequence[sequence] = feature_dict
         features_for_chain[protein.PDB_CHAIN_IDS[sequence_index - 1]] = feature_dict
 
     # Further feature post-processing depending on the model type
@@ -627,26 +879,60 @@ def alphafold(
 
     plddts = {}
     ranking_confidences = {}
-    pae_outputs = {}
-    unrelaxed_proteins = {}
+    # Each model's PAE and unrelaxed structure are streamed to disk as they
+    # complete (only file paths are kept in memory), so peak RAM does not grow
+    # with the number of models
+    pae_output_paths = {}
+    unrelaxed_pdb_paths = {}
+
+    from tqdm import tqdm
 
     with tqdm(total=len(model_names) + 1, bar_format=TQDM_BAR_FORMAT) as pbar:
-        for model_name in model_names:
-            # Set progress bar description
-            pbar.set_description(f"Running {model_name}")
+        # Params only need to be loaded for models without a cached runner
+        models_to_load = collections.deque(
+            name
+            for name in model_names
+            if (name, model_type_to_use.name, multimer_recycles)
+            not in model_runner_cache
+        )
 
-            cfg = config.model_config(model_name)
-            if model_type_to_use == ModelType.MONOMER:
-                cfg.data.eval.num_ensemble = 1
-            elif model_type_to_use == ModelType.MULTIMER:
-                cfg.model.num_ensemble_eval = 1
+        # Prefetch each model's parameters from disk on a background thread while
+        # the previous model is running inference
+        params_executor = futures.ThreadPoolExecutor(max_workers=1)
+        params_future = None
+        if models_to_load:
+            params_future = params_executor.submit(
+                data.get_model_haiku_params, models_to_load[0], PARAMS_DIR
+            )
 
-            if model_type_to_use == ModelType.MULTIMER:
-                cfg.model.num_recycle = multimer_recycles
-                cfg.model.recycle_early_stop_tolerance = 0.5
+        for model_index, model_name in enumerate(model_names):
+            # Set progress bar description
+            pbar.set_description(f"Running {model_name}")
 
-            params = data.get_model_haiku_params(model_name, PARAMS_DIR)
-            model_runner = model.RunModel(cfg, params)
+            # Reuse the model runner compiled for an earlier call with the same
+            # settings, so JAX does not re-JIT the model graph for every run
+            runner_key = (model_name, model_type_to_use.name, multimer_recycles)
+            model_runner = model_runner_cache.get(runner_key)
+            if model_runner is None:
+                cfg = config.model_config(model_name)
+                if model_type_to_use == ModelType.MONOMER:
+                    cfg.data.eval.num_ensemble = 1
+                elif model_type_to_use == ModelType.MULTIMER:
+                    cfg.model.num_ensemble_eval = 1
+
+                if model_type_to_use == ModelType.MULTIMER:
+                    cfg.model.num_recycle = multimer_recycles
+                    cfg.model.recycle_early_stop_tolerance = 0.5
+
+                # This model is at the head of the parameter prefetch queue
+                models_to_load.popleft()
+                params = params_future.result()
+                if models_to_load:
+                    params_future = params_executor.submit(
+                        data.get_model_haiku_params, models_to_load[0], PARAMS_DIR
+                    )
+                model_runner = model.RunModel(cfg, params)
+                model_runner_cache[runner_key] = model_runner
             processed_feature_dict = model_runner.process_features(
                 np_example, random_seed=0
             )
@@ -654,29 +940,39 @@ def alphafold(
                 processed_feature_dict, random_seed=random.randrange(sys.maxsize)
             )
 
+            # Materialize the arrays that are reused below with a single
+            # device-to-host copy each (predictions may live on the GPU as
+            # JAX DeviceArrays, and every separate access forces a transfer)
+            plddt_np = np.asarray(prediction["plddt"])
+            final_atom_mask = np.asarray(
+                prediction["structure_module"]["final_atom_mask"]
+            )
+
+            def save_pae():
+                model_pae_path = os.path.join(abs_out_path, f"{model_name}_pae.npz")
+                np.savez(
+                    model_pae_path,
+                    pae=np.asarray(prediction["predicted_aligned_error"]),
+                    max_pae=np.asarray(prediction["max_predicted_aligned_error"]),
+                )
+                pae_output_paths[model_name] = model_pae_path
+
             if model_type_to_use == ModelType.MONOMER:
                 if "predicted_aligned_error" in prediction:
-                    pae_outputs[model_name] = (
-                        prediction["predicted_aligned_error"],
-                        prediction["max_predicted_aligned_error"],
-                    )
+                    save_pae()
                 else:
                     # Monomer models are sorted by mean pLDDT. Do not put monomer pTM models here as they
                     # should never get selected.
                     ranking_confidences[model_name] = prediction["ranking_confidence"]
-                    plddts[model_name] = prediction["plddt"]
+                    plddts[model_name] = plddt_np
             elif model_type_to_use == ModelType.MULTIMER:
                 # Multimer models are sorted by pTM+ipTM.
                 ranking_confidences[model_name] = prediction["ranking_confidence"]
-                plddts[model_name] = prediction["plddt"]
-                pae_outputs[model_name] = (
-                    prediction["predicted_aligned_error"],
-                    prediction["max_predicted_aligned_error"],
-                )
+                plddts[model_name] = plddt_np
+                save_pae()
 
             # Set the b-factors to the per-residue plddt.
-            final_atom_mask = prediction["structure_module"]["final_atom_mask"]
-            b_factors = prediction["plddt"][:, None] * final_atom_mask
+            b_factors = plddt_np[:, None] * final_atom_mask
             unrelaxed_protein = protein.from_prediction(
                 processed_feature_dict,
                 prediction,
@@ -685,53 +981,103 @@ def alphafold(
                     model_type_to_use == ModelType.MONOMER
                 ),
             )
-            unrelaxed_proteins[model_name] = unrelaxed_protein
+            unrelaxed_pdb_path = os.path.join(
+                abs_out_path, f"{model_name}_unrelaxed.pdb"
+            )
+            with open(unrelaxed_pdb_path, "w") as f:
+                f.write(protein.to_pdb(unrelaxed_protein))
+            unrelaxed_pdb_paths[model_name] = unrelaxed_pdb_path
 
             # Delete unused outputs to save memory
+            # (the model runner itself stays in model_runner_cache for reuse)
+            del unrelaxed_protein
             del model_runner
-            del params
             del prediction
             pbar.update(n=1)
 
+        params_executor.shutdown()
+
         ## AMBER relax the best model
         # Find the best model according to the mean pLDDT.
         best_model_name = max(
             ranking_confidences.keys(), key=lambda x: ranking_confidences[x]
         )
 
+        # Load the best model's streamed structure back from disk
+        with open(unrelaxed_pdb_paths[best_model_name]) as f:
+            best_unrelaxed_pdb = f.read()
+
         if relax:
             pbar.set_description(f"AMBER relaxation")
 
+            # Relax on the GPU when the OpenMM CUDA platform is available -
+            # CPU relaxation can take hours for large complexes
+            try:
+                openmm.Platform.getPlatformByName("CUDA")
+                relax_use_gpu = True
+            except Exception:
+                relax_use_gpu = False
+            if verbose:
+                logger.info(
+                    f"Running AMBER relaxation on the {'GPU (CUDA)' if relax_use_gpu else 'CPU'}."
+                )
+
             amber_relaxer = run_relax.AmberRelaxation(
                 max_iterations=0,
                 tolerance=2.39,
                 stiffness=10.0,
                 exclude_residues=[],
                 max_outer_iterations=3,
-                use_gpu=False,
-            )
-            relaxed_pdb, _, _ = amber_relaxer.process(
-                prot=unrelaxed_proteins[best_model_name]
+                use_gpu=relax_use_gpu,
             )
+            try:
+                relaxed_pdb, _, _ = amber_relaxer.process(
+                    prot=protein.from_pdb_string(best_unrelaxed_pdb)
+                )
+            except Exception as e:
+                # The CUDA platform can load on hosts without a usable GPU
+                # and only fail inside the relaxation itself -> retry on CPU
+                if not relax_use_gpu:
+                    raise
+                logger.warning(
+                    f"AMBER relaxation on the GPU failed ({e}). Retrying on the CPU."
+                )
+                amber_relaxer = run_relax.AmberRelaxation(
+                    max_iterations=0,
+                    tolerance=2.39,
+                    stiffness=10.0,
+                    exclude_residues=[],
+                    max_outer_iterations=3,
+                    use_gpu=False,
+                )
+                relaxed_pdb, _, _ = amber_relaxer.process(
+                    prot=protein.from_pdb_string(best_unrelaxed_pdb)
+                )
         else:
             logger.warning(
                 "\nRunning model without relaxation stage. Use flag [--relax] ('relax=True') to include AMBER relaxation."
             )
-            relaxed_pdb = protein.to_pdb(unrelaxed_proteins[best_model_name])
+            relaxed_pdb = best_unrelaxed_pdb
 
         pbar.update(n=1)
 
-    pae, max_pae = list(pae_outputs.values())[0]
+    with np.load(list(pae_output_paths.values())[0]) as pae_npz:
+        pae = pae_npz["pae"]
+        max_pae = pae_npz["max_pae"]
 
     if out is not None:
-        ## Save the prediction
-        pred_output_path = os.path.join(abs_out_path, "selected_prediction.pdb")
-        with open(pred_output_path, "w") as f:
-            f.write(relaxed_pdb)
-
-        ## Save the predicted aligned error
-        pae_output_path = os.path.join(abs_out_path, "predicted_aligned_error.json")
-        if pae_outputs:
+
+        def save_prediction():
+            ## Save the prediction
+            pred_output_path = os.path.join(abs_out_path, "selected_prediction.pdb")
+            with open(pred_output_path, "w") as f:
+                f.write(relaxed_pdb)
+
+        def save_pae_json():
+            ## Save the predicted aligned error
+            pae_output_path = os.path.join(
+                abs_out_path, "predicted_aligned_error.json"
+            )
             # Check the PAE array is the correct shape
             if pae.ndim != 2 or pae.shape[0] != pae.shape[1]:
                 raise ValueError(f"PAE must be a square matrix, got {pae.shape}")
@@ -747,41 +1093,66 @@ def alphafold(
                 "final_atom_mask": final_atom_mask.tolist(),
             }
 
-            with open(pae_output_path, "w", encoding="utf-8") as f:
-                json.dump(formatted_output, f, ensure_ascii=False, indent=4)
+            # Keep the JSON compact: the 1-decimal rounding above (matching the
+            # AlphaFold DB format) plus no indentation whitespace shrinks the
+            # N x N payload several-fold versus pretty-printing
+            # Large buffer to keep syscall count down for the big JSON payload
+            with open(
+                pae_output_path, "w", encoding="utf-8", buffering=1 << 20
+            ) as f:
+                json.dump(
+                    formatted_output, f, ensure_ascii=False, separators=(",", ":")
+                )
+
+        # The two output files are independent I/O streams -> write them
+        # concurrently (future.result() re-raises any error from the writes)
+        with futures.ThreadPoolExecutor(max_workers=2) as save_executor:
+            save_futures = [save_executor.submit(save_prediction)]
+            if pae_output_paths:
+                save_futures.append(save_executor.submit(save_pae_json))
+            for f in save_futures:
+                f.result()
 
     ## Plotting
     if plot:
         if verbose:
             logger.info("Plotting prediction results.")
         import py3Dmol
+        import matplotlib.pyplot as plt
+        from IPython import display
+        from ipywidgets import GridspecLayout
+        from ipywidgets import Output
 
         # Construct multiclass b-factors to indicate confidence bands
         # 0=very low, 1=low, 2=confident, 3=very high
-        banded_b_factors = []
-        for plddt in plddts[best_model_name]:
-            for idx, (min_val, max_val, _) in enumerate(PLDDT_BANDS):
-                if plddt >= min_val and plddt <= max_val:
-                    banded_b_factors.append(idx)
-                    break
-
-        banded_b_factors = np.array(banded_b_factors)[:, None] * final_atom_mask
+        # Assign all residues to their band in one vectorized pass over the band edges
+        banded_b_factors = np.digitize(
+            np.asarray(plddts[best_model_name]), PLDDT_BAND_EDGES, right=True
+        )
+        banded_b_factors = banded_b_factors[:, None] * final_atom_mask
         to_visualize_pdb = utils.overwrite_b_factors(relaxed_pdb, banded_b_factors)
 
         # Show the structure coloured by chain if the multimer model has been used.
         if model_type_to_use == ModelType.MULTIMER:
+            # A CA-only trace is enough for the cartoon chain overview and is
+            # much cheaper for 3Dmol.js to parse than the full atom record
+            ca_only_pdb = "\n".join(
+                line
+                for line in to_visualize_pdb.splitlines()
+                if not line.startswith(("ATOM", "HETATM"))
+                or line[12:16].strip() == "CA"
+            )
             multichain_view = py3Dmol.view(width=800, height=600)
-            multichain_view.addModelsAsFrames(to_visualize_pdb)
+            multichain_view.addModelsAsFrames(ca_only_pdb)
             multichain_style = {"cartoon": {"colorscheme": "chain"}}
             multichain_view.setStyle({"model": -1}, multichain_style)
             multichain_view.zoomTo()
             multichain_view.show()
 
         # Color the structure by per-residue pLDDT
-        color_map = {i: bands[2] for i, bands in enumerate(PLDDT_BANDS)}
         view = py3Dmol.view(width=800, height=600)
         view.addModelsAsFrames(to_visualize_pdb)
-        style = {"cartoon": {"colorscheme": {"prop": "b", "map": color_map}}}
+        style = {"cartoon": {"colorscheme": {"prop": "b", "map": PLDDT_COLOR_MAP}}}
         if show_sidechains:
             style["stick"] = {}
         view.setStyle({"model": -1}, style)
@@ -801,7 +1172,7 @@ def alphafold(
         display.display(grid)
 
         # Display pLDDT and predicted aligned error (if output by the model).
-        if pae_outputs:
+        if pae_output_paths:
             num_plots = 2
         else:
             num_plots = 1
@@ -815,25 +1186,28 @@ def alphafold(
 
         if num_plots == 2:
             plt.subplot(1, 2, 2)
-            plt.imshow(pae, vmin=0.0, vmax=max_pae, cmap="Greens_r")
+            # Hand imshow a contiguous float32 array so matplotlib's norm/cmap
+            # stage doesn't convert (and upcast) the matrix itself, and use
+            # nearest-neighbor interpolation for the residue-by-residue grid
+            pae_np = np.ascontiguousarray(np.asarray(pae), dtype=np.float32)
+            plt.imshow(
+                pae_np,
+                vmin=0.0,
+                vmax=max_pae,
+                cmap="Greens_r",
+                interpolation="nearest",
+            )
             plt.colorbar(fraction=0.046, pad=0.04)
 
             # Display lines at chain boundaries.
-            best_unrelaxed_prot = unrelaxed_proteins[best_model_name]
+            best_unrelaxed_prot = protein.from_pdb_string(best_unrelaxed_pdb)
             total_num_res = best_unrelaxed_prot.residue_index.shape[-1]
             chain_ids = best_unrelaxed_prot.chain_index
-            for chain_boundary in np.nonzero(chain_ids[:-1] - chain_ids[1:]):
-                if chain_boundary.size:
-                    plt.plot(
-                        [0, total_num_res],
-                        [chain_boundary, chain_boundary],
-                        color="red",
-                    )
-                    plt.plot(
-                        [chain_boundary, chain_boundary],
-                        [0, total_num_res],
-                        color="red",
-                    )
+            chain_boundaries = np.flatnonzero(np.diff(chain_ids))
+            if chain_boundaries.size:
+                # Draw all boundaries as two batched line collections
+                plt.hlines(chain_boundaries, 0, total_num_res, colors="red")
+                plt.vlines(chain_boundaries, 0, total_num_res, colors="red")
 
             plt.title("Predicted Aligned Error")
             plt.xlabel("Scored residue")
@@ -847,5 +1221,14 @@ def alphafold(
                     transparent=True,
                 )
 
+    # Remove the per-model intermediates streamed to disk during prediction;
+    # they are not part of the documented output (and for out=None they would
+    # keep clean_up from deleting the temporary folder)
+    for path in list(unrelaxed_pdb_paths.values()) + list(
+        pae_output_paths.values()
+    ):
+        if os.path.exists(path):
+            os.remove(path)
+
     ## Run clean_up function
     clean_up()
@@ -1,10 +1,13 @@
 import os
 import logging
 import shutil
+import importlib.util
+from importlib import metadata
 import sys
 import subprocess
 import platform
 import uuid
+from concurrent import futures
 from platform import python_version
 
 from .utils import set_up_logger
@@ -38,7 +41,23 @@ PARAMS_URL = (
     "https://storage.googleapis.com/alphafold/alphafold_params_colab_2022-12-06.tar"
 )
 PARAMS_DIR = os.path.join(PACKAGE_PATH, "bins/alphafold/")
-PARAMS_PATH = os.path.join(PARAMS_DIR, "params_temp.tar")
+
+
+def _run_command(command, error_message):
+    """
+    Support function to run a subprocess command (list of arguments, no shell)
+    and log its stderr plus error_message if it fails.
+    Returns True if the command succeeded, else False.
+    """
+    process = subprocess.run(command, stderr=subprocess.PIPE)
+    if process.returncode != 0:
+        stderr = process.stderr.decode("utf-8")
+        if stderr:
+            # Log the standard error if it is not empty
+            sys.stderr.write(stderr)
+        logger.error(error_message)
+        return False
+    return True
 
 
 def setup(module, verbose=True, out=None):
@@ -63,17 +82,10 @@ def setup(module, verbose=True, out=None):
     if module == "gpt":
         if verbose:
             logger.info("Installing openai version <=0.28.1 (requires pip).")
-        command = "pip install -q -U 'openai<=0.28.1'"
-        with subprocess.Popen(command, shell=True, stderr=subprocess.PIPE) as process:
-            stderr = process.stderr.read().decode("utf-8")
-        # Exit system if the subprocess returned with an error
-        if process.wait() != 0:
-            if stderr:
-                # Log the standard error if it is not empty
-                sys.stderr.write(stderr)
-            logger.error(
-                "Installation of openai version <=0.28.1 with pip (https://pypi.org/project/openai) failed."
-            )
+        if not _run_command(
+            [sys.executable, "-m", "pip", "install", "-q", "-U", "openai<=0.28.1"],
+            "Installation of openai version <=0.28.1 with pip (https://pypi.org/project/openai) failed.",
+        ):
             return
 
         # Test installation
@@ -91,17 +103,10 @@ def setup(module, verbose=True, out=None):
     if module == "cellxgene":
         if verbose:
             logger.info("Installing cellxgene-census package (requires pip).")
-        command = "pip install -q -U cellxgene-census"
-        with subprocess.Popen(command, shell=True, stderr=subprocess.PIPE) as process:
-            stderr = process.stderr.read().decode("utf-8")
-        # Exit system if the subprocess returned with an error
-        if process.wait() != 0:
-            if stderr:
-                # Log the standard error if it is not empty
-                sys.stderr.write(stderr)
-            logger.error(
-                "cellxgene-census installation with pip (https://pypi.org/project/cellxgene-census) failed."
-            )
+        if not _run_command(
+            [sys.executable, "-m", "pip", "install", "-q", "-U", "cellxgene-census"],
+            "cellxgene-census installation with pip (https://pypi.org/project/cellxgene-census) failed.",
+        ):
             return
 
         # Test installation
@@ -146,33 +151,18 @@ def setup(module, verbose=True, out=None):
             if not os.path.exists(ELM_FILES):
                 os.makedirs(ELM_FILES)
 
-        if platform.system() == "Windows":
-            # The double-quotation marks allow white spaces in the path, but this does not work for Windows
-            command = f"""
-                curl -o {elm_instances_fasta} \"{ELM_INSTANCES_FASTA_DOWNLOAD}\" \
-                &&  curl -o {elm_classes_tsv} \"{ELM_CLASSES_TSV_DOWNLOAD}\" \
-                &&  curl -o {elm_instances_tsv} \"{ELM_INSTANCES_TSV_DOWNLOAD}\" \
-                &&  curl -o {elm_intdomains_tsv} \"{ELM_INTDOMAINS_TSV_DOWNLOAD}\"
-                """
-        
-        else:
-            command = f"""
-                curl -o '{elm_instances_fasta}' {ELM_INSTANCES_FASTA_DOWNLOAD} \
-                &&  curl -o '{elm_classes_tsv}' {ELM_CLASSES_TSV_DOWNLOAD} \
-                &&  curl -o '{elm_instances_tsv}' {ELM_INSTANCES_TSV_DOWNLOAD} \
-                &&  curl -o '{elm_intdomains_tsv}' '{ELM_INTDOMAINS_TSV_DOWNLOAD}'
-                """
-
-        with subprocess.Popen(command, shell=True, stderr=subprocess.PIPE) as process:
-            stderr = process.stderr.read().decode("utf-8")
-            # Log the standard error if it is not empty
-            if stderr:
-                sys.stderr.write(stderr)
-
-        # Exit system if the subprocess returned with an error
-        if process.wait() != 0:
-            logger.error("ELM database files download failed.")
-            return
+        for elm_file, elm_download in (
+            (elm_instances_fasta, ELM_INSTANCES_FASTA_DOWNLOAD),
+            (elm_classes_tsv, ELM_CLASSES_TSV_DOWNLOAD),
+            (elm_instances_tsv, ELM_INSTANCES_TSV_DOWNLOAD),
+            (elm_intdomains_tsv, ELM_INTDOMAINS_TSV_DOWNLOAD),
+        ):
+            # Exit system if the subprocess returned with an error
+            if not _run_command(
+                ["curl", "-o", elm_file, elm_download],
+                "ELM database files download failed.",
+            ):
+                return
 
         # Check if files are present
         if os.path.exists(elm_instances_fasta):
@@ -206,63 +196,48 @@ def setup(module, verbose=True, out=None):
             )
 
         ## Ask user to install openmm if not already installed
+        # Probe for openmm without importing it; the import loads the OpenMM
+        # (and, where present, CUDA) shared libraries, which are only needed
+        # at prediction time
         try:
-            import simtk.openmm as openmm
-
-            # Silence openmm logger
-            logging.getLogger("openmm").setLevel(logging.WARNING)
-
-            # Commenting the following out because openmm v7.7.0 does not support __version__
-            # # Check if correct version was installed
-            # if openmm.__version__ != "7.5.1":
-            #     raise ImportError()
-
-            # if verbose:
-            #   logger.info(f"openmm v{openmm.__version__} already installed.")
+            openmm_spec = importlib.util.find_spec("openmm") or importlib.util.find_spec(
+                "simtk.openmm"
+            )
+        except ModuleNotFoundError:
+            openmm_spec = None
 
-        except ImportError as e:
+        if openmm_spec is None:
             raise ImportError(
-                f"""
-                Trying to import openmm resulted in the following error:
-                {e}
+                """
+                AlphaFold third-party dependency openmm is not installed.
 
-                Please install AlphaFold third-party dependency openmm v7.5.1 (or v7.7.0 for Python >= 3.10) by running the following command from the command line: 
+                Please install AlphaFold third-party dependency openmm v7.5.1 (or v7.7.0 for Python >= 3.10) by running the following command from the command line:
                 'conda install -qy conda==4.13.0 && conda install -qy -c conda-forge openmm=7.5.1'   (or 'openmm=7.7.0' for Python >= 3.10)
                 (Recommendation: Follow with 'conda update -qy conda' to update conda to the latest version afterwards.)
                 """
             )
 
-        ## Install py3Dmol
-        if verbose:
-            logger.info("Installing py3Dmol (requires pip).")
-        command = "pip install -q py3Dmol"
-        with subprocess.Popen(command, shell=True, stderr=subprocess.PIPE) as process:
-            stderr = process.stderr.read().decode("utf-8")
-        # Exit system if the subprocess returned with an error
-        if process.wait() != 0:
-            if stderr:
-                # Log the standard error if it is not empty
-                sys.stderr.write(stderr)
-            logger.error(
-                "py3Dmol installation with pip (https://pypi.org/project/py3Dmol) failed."
-            )
-            return
-
-        # Test installation
-        try:
-            import py3Dmol
+        # Silence openmm logger
+        logging.getLogger("openmm").setLevel(logging.WARNING)
 
+        ## Install py3Dmol
+        def install_py3dmol():
+            """
+            Support function to pip install py3Dmol.
+            Returns True if the installation succeeded, else False.
+            """
             if verbose:
-                logger.info(f"py3Dmol installed succesfully.")
-        except ImportError as e:
-            logger.error(
-                f"py3Dmol installation with pip (https://pypi.org/project/py3Dmol/) failed. Import error:\n{e}"
+                logger.info("Installing py3Dmol (requires pip).")
+            return _run_command(
+                [sys.executable, "-m", "pip", "install", "-q", "py3Dmol"],
+                "py3Dmol installation with pip (https://pypi.org/project/py3Dmol) failed.",
             )
-            return
 
-        ## Install Alphafold if not already installed
+        ## Install AlphaFold and pdbfixer if not already installed
         if verbose:
-            logger.info("Installing AlphaFold from source (requires pip and git).")
+            logger.info(
+                "Installing AlphaFold and pdbfixer from source (requires pip and git)."
+            )
 
         ## Install AlphaFold and change jackhmmer directory where database chunks are saved in
         # Define AlphaFold folder name and location
@@ -270,146 +245,167 @@ def setup(module, verbose=True, out=None):
             PACKAGE_PATH, "tmp_alphafold_" + str(uuid.uuid4())
         )
 
-        # Clone AlphaFold github repo
-        # Replace directory where jackhmmer database chunks will be saved
-        # Insert "logging.set_verbosity(logging.WARNING)" to mute all info loggers
-        # Pip install AlphaFold from local directory
-        if platform.system() == "Darwin":
-            command = """
-                git clone --branch main -q --branch {} {} {} \
-                && sed -i '' 's/\/tmp\/ramdisk/{}/g' {}/alphafold/data/tools/jackhmmer.py \
-                && sed -i '' 's/from absl import logging/from absl import logging\\\logging.set_verbosity(logging.WARNING)/g' {}/alphafold/data/tools/jackhmmer.py \
-                && pip install -q -r {}/requirements.txt \
-                && pip install -q --no-dependencies {}
-                """.format(
-                ALPHAFOLD_GIT_REPO_VERSION,
-                ALPHAFOLD_GIT_REPO,
-                alphafold_folder,
-                os.path.expanduser(f"~/tmp/jackhmmer/{UUID}").replace(
-                    "/", "\/"
-                ),  # Replace directory where jackhmmer database chunks will be saved
-                alphafold_folder,
-                alphafold_folder,
-                alphafold_folder,
-                alphafold_folder,
+        def clone_alphafold():
+            """
+            Support function to clone the AlphaFold repo and patch its
+            jackhmmer wrapper.
+            Returns True if the clone succeeded, else False.
+            """
+            # Clone AlphaFold github repo
+            if not _run_command(
+                [
+                    "git",
+                    "clone",
+                    "-q",
+                    # The clone is deleted right after the pip install, so
+                    # skip the repo history and other branches
+                    "--depth=1",
+                    "--single-branch",
+                    "--branch",
+                    ALPHAFOLD_GIT_REPO_VERSION,
+                    ALPHAFOLD_GIT_REPO,
+                    alphafold_folder,
+                ],
+                "AlphaFold installation failed.",
+            ):
+                return False
+
+            # Replace directory where jackhmmer database chunks will be saved
+            # and insert "logging.set_verbosity(logging.WARNING)" to mute all
+            # info loggers (done in Python instead of sed to avoid shell
+            # escaping and GNU/BSD sed differences)
+            jackhmmer_py = os.path.join(
+                alphafold_folder, "alphafold/data/tools/jackhmmer.py"
             )
-        else:
-            command = """
-                git clone --branch main -q --branch {} {} {} \
-                && sed -i 's/\/tmp\/ramdisk/{}/g' {}/alphafold/data/tools/jackhmmer.py \
-                && sed -i 's/from absl import logging/from absl import logging\\\nlogging.set_verbosity(logging.WARNING)/g' {}/alphafold/data/tools/jackhmmer.py \
-                && pip install -q -r {}/requirements.txt \
-                && pip install -q --no-dependencies {}
-                """.format(
-                ALPHAFOLD_GIT_REPO_VERSION,
-                ALPHAFOLD_GIT_REPO,
-                alphafold_folder,
-                os.path.expanduser(f"~/tmp/jackhmmer/{UUID}").replace(
-                    "/", "\/"
-                ),  # Replace directory where jackhmmer database chunks will be saved
-                alphafold_folder,
-                alphafold_folder,
-                alphafold_folder,
-                alphafold_folder,
+            chunk_dir = os.path.expanduser(f"~/tmp/jackhmmer/{UUID}")
+
+            with open(jackhmmer_py, "r") as f:
+                jackhmmer_src = f.read()
+            jackhmmer_src = jackhmmer_src.replace("/tmp/ramdisk", chunk_dir)
+            jackhmmer_src = jackhmmer_src.replace(
+                "from absl import logging",
+                "from absl import logging\nlogging.set_verbosity(logging.WARNING)",
+                1,
             )
+            with open(jackhmmer_py, "w") as f:
+                f.write(jackhmmer_src)
 
-        with subprocess.Popen(command, shell=True, stderr=subprocess.PIPE) as process:
-            stderr = process.stderr.read().decode("utf-8")
-        # Exit system if the subprocess returned with an error
-        if process.wait() != 0:
-            if stderr:
-                # Log the standard error if it is not empty
-                sys.stderr.write(stderr)
-            logger.error("AlphaFold installation failed.")
-            return
-
-        # Remove cloned directory
-        shutil.rmtree(alphafold_folder)
-
-        try:
-            import alphafold as AlphaFold
-
-            if verbose:
-                logger.info(f"AlphaFold installed succesfully.")
-        except ImportError as e:
-            logger.error(f"AlphaFold installation failed. Import error:\n{e}")
-            return
+            return True
 
-        ## Append AlphaFold to path
-        alphafold_path = os.path.abspath(os.path.dirname(AlphaFold.__file__))
-        if alphafold_path not in sys.path:
-            sys.path.append(alphafold_path)
+        def install_alphafold():
+            """
+            Support function to pip install AlphaFold from the local clone.
+            Returns True if the installation succeeded, else False.
+            """
+            commands = [
+                [
+                    sys.executable,
+                    "-m",
+                    "pip",
+                    "install",
+                    "-q",
+                    "-r",
+                    os.path.join(alphafold_folder, "requirements.txt"),
+                ],
+                [
+                    sys.executable,
+                    "-m",
+                    "pip",
+                    "install",
+                    "-q",
+                    "--no-dependencies",
+                    alphafold_folder,
+                ],
+            ]
+
+            for command in commands:
+                if not _run_command(command, "AlphaFold installation failed."):
+                    return False
+
+            # Remove cloned directory
+            shutil.rmtree(alphafold_folder)
+            return True
 
         ## Install pdbfixer
-        if verbose:
-            logger.info("Installing pdbfixer from source (requires pip and git).")
-
         pdbfixer_folder = os.path.join(
             PACKAGE_PATH, "tmp_pdbfixer_" + str(uuid.uuid4())
         )
 
+        # Only the openmm version is needed here, so fetch it from the package
+        # metadata instead of importing openmm itself
         try:
-            if openmm.__version__ == "7.5.1":
+            if metadata.version("openmm") == "7.5.1":
                 # Install pdbfixer version compatible with openmm v7.5.1
                 PDBFIXER_VERSION = "v1.7"
             else:
                 PDBFIXER_VERSION = "v1.8.1"
-        except:
+        except metadata.PackageNotFoundError:
             PDBFIXER_VERSION = "v1.8.1"
 
-        command = f"""
-            git clone -q --branch {PDBFIXER_VERSION} {PDBFIXER_GIT_REPO} {pdbfixer_folder} \
-            && pip install -q {pdbfixer_folder} \
+        def clone_pdbfixer():
             """
+            Support function to clone the pdbfixer repo.
+            Returns True if the clone succeeded, else False.
+            """
+            return _run_command(
+                [
+                    "git",
+                    "clone",
+                    "-q",
+                    "--depth=1",
+                    "--single-branch",
+                    "--branch",
+                    PDBFIXER_VERSION,
+                    PDBFIXER_GIT_REPO,
+                    pdbfixer_folder,
+                ],
+                "pdbfixer installation failed.",
+            )
 
-        with subprocess.Popen(command, shell=True, stderr=subprocess.PIPE) as process:
-            stderr = process.stderr.read().decode("utf-8")
-        # Exit system if the subprocess returned with an error
-        if process.wait() != 0:
-            if stderr:
-                # Log the standard error if it is not empty
-                sys.stderr.write(stderr)
-            logger.error("pdbfixer installation failed.")
-            return
-
-        # Remove cloned directory
-        shutil.rmtree(pdbfixer_folder)
-
-        # Check if pdbfixer was installed successfully
-        command = "pip list | grep pdbfixer"
-        process = subprocess.Popen(command, shell=True, stdout=subprocess.PIPE)
-        pdb_out, err = process.communicate()
+        def install_pdbfixer():
+            """
+            Support function to pip install pdbfixer from the local clone.
+            Returns True if the installation succeeded, else False.
+            """
+            if not _run_command(
+                [sys.executable, "-m", "pip", "install", "-q", pdbfixer_folder],
+                "pdbfixer installation failed.",
+            ):
+                return False
 
-        if pdb_out.decode() != "":
-            logger.info(f"pdbfixer installed succesfully.")
-        else:
-            logger.error("pdbfixer installation failed.")
-            return
+            # Remove cloned directory
+            shutil.rmtree(pdbfixer_folder)
+            return True
 
         ## Download model parameters
-        # Download parameters if the params directory is empty
-        if not os.path.exists(os.path.join(PARAMS_DIR, "params/")):
-            # Create folder to save parameter files
-            os.makedirs(os.path.join(PARAMS_DIR, "params/"), exist_ok=True)
+        def download_params():
+            """
+            Support function to download and extract the AlphaFold model parameters.
+            Returns True if the parameters are present afterwards, else False.
+            """
+            # Download parameters if the params directory is empty
+            if not os.path.exists(os.path.join(PARAMS_DIR, "params/")):
+                # Create folder to save parameter files
+                os.makedirs(os.path.join(PARAMS_DIR, "params/"), exist_ok=True)
+
+            if len(os.listdir(os.path.join(PARAMS_DIR, "params/"))) >= 12:
+                if verbose:
+                    logger.info("AlphaFold model parameters already downloaded.")
+                return True
 
-        if len(os.listdir(os.path.join(PARAMS_DIR, "params/"))) < 12:
             if verbose:
                 logger.info(
                     "Downloading AlphaFold model parameters (requires 4.1 GB of storage). This might take a few minutes."
                 )
+            # Pipe curl directly into tar so extraction overlaps the download and
+            # no 4.1 GB temporary tarball is written to disk; the pipe between
+            # the two processes is why this one uses a shell
+            # (a truncated download makes tar fail on the incomplete archive)
             if platform.system() == "Windows":
                 # The double-quotation marks allow white spaces in the path, but this does not work for Windows
-                command = f"""
-                    curl -# -o {PARAMS_PATH} {PARAMS_URL} \
-                    && tar --extract --file={PARAMS_PATH} --directory={PARAMS_DIR+'params/'} --preserve-permissions \
-                    && rm {PARAMS_PATH}
-                    """
+                command = f'curl -#L {PARAMS_URL} | tar --extract --file=- --directory={PARAMS_DIR + "params/"} --preserve-permissions'
             else:
-                command = f"""
-                    curl -# -o '{PARAMS_PATH}' '{PARAMS_URL}' \
-                    && tar --extract --file='{PARAMS_PATH}' --directory='{PARAMS_DIR+'params/'}' --preserve-permissions \
-                    && rm '{PARAMS_PATH}'
-                    """
+                command = f"curl -#L '{PARAMS_URL}' | tar --extract --file=- --directory='{PARAMS_DIR+'params/'}' --preserve-permissions"
 
             with subprocess.Popen(
                 command, shell=True, stderr=subprocess.PIPE
@@ -418,13 +414,67 @@ def setup(module, verbose=True, out=None):
                 # Log the standard error if it is not empty
                 if stderr:
                     sys.stderr.write(stderr)
-            # Exit system if the subprocess returned with an error
             if process.wait() != 0:
                 logger.error("Model parameter download failed.")
+                return False
+
+            if verbose:
+                logger.info("Model parameter download complete.")
+            return True
+
+        # The git clones and the 4.1 GB parameter download are independent
+        # network-bound steps -> run them concurrently. The pip installs
+        # share one site-packages and pip takes no lock, so they run
+        # sequentially (on this thread) while the parameter download
+        # continues in the background
+        with futures.ThreadPoolExecutor(max_workers=3) as executor:
+            params_future = executor.submit(download_params)
+            clone_results = [
+                executor.submit(clone_alphafold),
+                executor.submit(clone_pdbfixer),
+            ]
+            if not all(f.result() for f in futures.as_completed(clone_results)):
                 return
-            else:
-                if verbose:
-                    logger.info("Model parameter download complete.")
-        else:
+
+            if not (
+                install_py3dmol() and install_alphafold() and install_pdbfixer()
+            ):
+                return
+
+            if not params_future.result():
+                return
+
+        # Test py3Dmol installation
+        try:
+            import py3Dmol
+
+            if verbose:
+                logger.info(f"py3Dmol installed succesfully.")
+        except ImportError as e:
+            logger.error(
+                f"py3Dmol installation with pip (https://pypi.org/project/py3Dmol/) failed. Import error:\n{e}"
+            )
+            return
+
+        try:
+            import alphafold as AlphaFold
+
             if verbose:
-                logger.info("AlphaFold model parameters already downloaded.")
+                logger.info(f"AlphaFold installed succesfully.")
+        except ImportError as e:
+            logger.error(f"AlphaFold installation failed. Import error:\n{e}")
+            return
+
+        ## Append AlphaFold to path
+        alphafold_path = os.path.abspath(os.path.dirname(AlphaFold.__file__))
+        if alphafold_path not in sys.path:
+            sys.path.append(alphafold_path)
+
+        # Check if pdbfixer was installed successfully
+        # (in-process metadata lookup instead of spawning pip list | grep)
+        try:
+            metadata.version("pdbfixer")
+            logger.info(f"pdbfixer installed succesfully.")
+        except metadata.PackageNotFoundError:
+            logger.error("pdbfixer installation failed.")
+            return
@@ -1248,6 +1248,29 @@ def main():
         required=False,
         help="AMBER relax the best model.",
     )
+    parser_alphafold.add_argument(
+        "-mb",
+        "--msa_backend",
+        default="jackhmmer",
+        type=str,
+        choices=["jackhmmer", "mmseqs2"],
+        required=False,
+        help=(
+            "Backend to use for the MSA search. 'mmseqs2' queries the remote ColabFold MMseqs2 server\n"
+            "instead of running a chunked Jackhmmer search (usually much faster)."
+        ),
+    )
+    parser_alphafold.add_argument(
+        "-mw",
+        "--num_msa_workers",
+        default=1,
+        type=int,
+        required=False,
+        help=(
+            "Number of parallel Jackhmmer searches to shard each database's chunks across.\n"
+            "Only applies to the 'jackhmmer' MSA backend."
+        ),
+    )
     parser_alphafold.add_argument(
         "-o",
         "--out",
@@ -2772,6 +2795,8 @@ def main():
             multimer_for_monomer=args.multimer_for_monomer,
             multimer_recycles=args.multimer_recycles,
             relax=args.relax,
+            msa_backend=args.msa_backend,
+            num_msa_workers=args.num_msa_workers,
             plot=False,
             show_sidechains=False,
             verbose=args.quiet,
@@ -0,0 +1,161 @@
+import io
+import tarfile
+import time
+import requests
+
+from .utils import set_up_logger
+logger = set_up_logger()
+
+from .constants import MMSEQS2_API
+
+
+def parse_a3m(a3m_text):
+    """
+    Parses an A3M-formatted alignment as returned by the MMseqs2 server.
+
+    Args:
+    - a3m_text      A3M alignment (str).
+
+    Returns aligned sequences, deletion matrix, and descriptions as three list objects.
+    In A3M format, lowercase letters are insertions relative to the query; they are
+    removed from the aligned sequences and counted in the deletion matrix instead.
+    """
+    sequences = []
+    deletion_matrix = []
+    descriptions = []
+
+    sequence_lines = []
+
+    def flush():
+        if not sequence_lines:
+            return
+        a3m_sequence = "".join(sequence_lines)
+        sequence_lines.clear()
+
+        aligned_sequence = []
+        deletion_row = []
+        deletion_count = 0
+        for res in a3m_sequence:
+            if res.islower():
+                deletion_count += 1
+            else:
+                aligned_sequence.append(res)
+                deletion_row.append(deletion_count)
+                deletion_count = 0
+
+        sequences.append("".join(aligned_sequence))
+        deletion_matrix.append(deletion_row)
+
+    # The ColabFold server uses NUL bytes as record separators in the
+    # returned A3M files -> strip them before parsing
+    for line in a3m_text.replace("\x00", "").splitlines():
+        line = line.strip()
+        # Skip empty lines and M8 metadata lines
+        if not line or line.startswith("#"):
+            continue
+        if line.startswith(">"):
+            flush()
+            descriptions.append(line[1:])
+        else:
+            sequence_lines.append(line)
+    flush()
+
+    return sequences, deletion_matrix, descriptions
+
+
+def run_mmseqs2(sequence, use_env=True, verbose=True):
+    """
+    Searches for an MSA for the given amino acid sequence using the remote
+    ColabFold MMseqs2 server (https://github.com/sokrypton/ColabFold).
+
+    Args:
+    - sequence      Amino acid sequence (str).
+    - use_env       True/False whether to also search the environmental sequence
+                    databases in addition to UniRef (default: True).
+    - verbose       True/False whether to print progress information. Default True.
+
+    Returns a dictionary mapping database name to the A3M alignment (str) returned
+    by the server.
+
+    If you use this function, please also cite the ColabFold paper
+    (https://doi.org/10.1038/s41592-022-00539-7).
+    """
+    mode = "env" if use_env else "all"
+    query = f">query\n{sequence}\n"
+
+    ## Submit the search job
+    sleep_time = 2
+    while True:
+        res = requests.post(
+            f"{MMSEQS2_API}/ticket/msa", data={"q": query, "mode": mode}
+        )
+        if not res.ok:
+            raise RuntimeError(
+                f"The MMseqs2 server returned error status code {res.status_code}. Please try again."
+            )
+        ticket = res.json()
+
+        if ticket.get("status") in ("RATELIMIT", "MAINTENANCE"):
+            # Server is rate-limiting submissions or down for maintenance
+            # -> wait and resubmit
+            time.sleep(sleep_time)
+            sleep_time = min(sleep_time * 2, 60)
+        else:
+            break
+
+    if ticket.get("status") == "ERROR":
+        raise RuntimeError(
+            "The MMseqs2 server could not process the query. Please confirm that the input is a valid amino acid sequence."
+        )
+
+    if "id" not in ticket:
+        raise RuntimeError(
+            f"The MMseqs2 server returned an unexpected response to the submitted query: {ticket}. Please try again."
+        )
+
+    ticket_id = ticket["id"]
+
+    ## Poll the server until the search is complete
+    if verbose:
+        logger.info("Waiting for MMseqs2 server results...")
+
+    sleep_time = 2
+    while True:
+        res = requests.get(f"{MMSEQS2_API}/ticket/{ticket_id}")
+        if not res.ok:
+            raise RuntimeError(
+                f"The MMseqs2 server returned error status code {res.status_code}. Please try again."
+            )
+        status = res.json().get("status")
+
+        if status == "COMPLETE":
+            break
+        if status == "ERROR":
+            raise RuntimeError(
+                "The MMseqs2 server could not process the query. Please confirm that the input is a valid amino acid sequence."
+            )
+
+        # Exponential backoff while the job is pending/running
+        time.sleep(sleep_time)
+        sleep_time = min(sleep_time * 1.5, 30)
+
+    ## Download and unpack the results
+    res = requests.get(f"{MMSEQS2_API}/result/download/{ticket_id}")
+    if not res.ok:
+        raise RuntimeError(
+            f"The MMseqs2 server returned error status code {res.status_code}. Please try again."
+        )
+
+    a3m_results = {}
+    with tarfile.open(fileobj=io.BytesIO(res.content), mode="r:gz") as tar:
+        for member in tar.getmembers():
+            if member.name.endswith(".a3m"):
+                db_name = member.name[: -len(".a3m")]
+                a3m_results[db_name] = tar.extractfile(member).read().decode()
+
+    if not a3m_results:
+        raise RuntimeError(
+            "The MMseqs2 server did not return any alignments. Please try again."
+        )
+
+    return a3m_results
@@ -74,6 +74,37 @@ def get_latest_cosmic():
     return int(soup.find("div", class_="news").get("id").split("v")[-1])
 
 
+def _read_fasta_mmap(fasta):
+    """
+    Support function for read_fasta.
+    Parses a large fasta file with a single C-level regex pass over a
+    memory-mapped buffer instead of iterating Python line objects.
+    """
+    import mmap
+
+    titles = []
+    seqs = []
+    with open(fasta, "rb") as fasta_file:
+        buf = mmap.mmap(fasta_file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            if buf[:1] != b">":
+                raise ValueError("Expected FASTA file to start with a '>' character. ")
+
+            for match in re.finditer(rb">([^\n]*)\n([^>]*)", buf):
+                # Concatenate sequence lines (handles sequences wrapped over multiple lines)
+                seq = b"".join(match.group(2).split()).decode()
+                if not seq:
+                    raise ValueError(
+                        "FASTA file contains two lines starting with '>' in a row -> missing sequence line. "
+                    )
+                titles.append(match.group(1).decode().strip().replace(">", ""))
+                seqs.append(seq)
+        finally:
+            buf.close()
+
+    return titles, seqs
+
+
 def read_fasta(fasta):
     """
     Args:
@@ -81,6 +112,10 @@ def read_fasta(fasta):
 
     Returns titles and seqs from fasta file as two list objects.
     """
+    # Parse large (e.g. batch submission) fasta files via a memory-mapped buffer
+    if os.path.getsize(fasta) > 1024 * 1024:
+        return _read_fasta_mmap(fasta)
+
     titles = []
     seqs = []
     title_last = False
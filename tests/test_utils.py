@@ -42,6 +42,58 @@ class TestUtils(unittest.TestCase):
 
         self.assertEqual(result_to_test, expected_result)
 
+    def test_read_fasta_mmap(self):
+        from gget.utils import _read_fasta_mmap
+
+        # The memory-mapped parser used for large files should return the
+        # same result as the line-by-line parser
+        self.assertEqual(
+            _read_fasta_mmap("tests/fixtures/muscle_nt_test.fa"),
+            read_fasta("tests/fixtures/muscle_nt_test.fa"),
+        )
+
+    def test_parse_a3m(self):
+        from gget.msa_mmseqs import parse_a3m
+
+        # M8 metadata lines are skipped, NUL record separators are stripped,
+        # and lowercase residues (insertions) are counted in the deletion
+        # matrix instead of the aligned sequences
+        a3m_text = "#query\tmeta\n\x00>query\nMKTA\n>hit1\nMkKT-\n"
+        sequences, deletion_matrix, descriptions = parse_a3m(a3m_text)
+
+        self.assertEqual(sequences, ["MKTA", "MKT-"])
+        self.assertEqual(deletion_matrix, [[0, 0, 0, 0], [0, 1, 0, 0]])
+        self.assertEqual(descriptions, ["query", "hit1"])
+
+    def test_msa_cache_round_trip(self):
+        import tempfile
+        from unittest.mock import patch
+        from gget import gget_alphafold
+
+        sequence = "MKTAYIAKQR"
+        raw_msa_results = {"uniref90": "dummy raw results"}
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with patch.object(gget_alphafold, "MSA_CACHE_DIR", tmp_dir):
+                # Uncached sequence is a miss
+                self.assertIsNone(gget_alphafold.load_msa_from_cache(sequence))
+
+                # Saved results are returned unchanged
+                gget_alphafold.save_msa_to_cache(sequence, raw_msa_results)
+                self.assertEqual(
+                    gget_alphafold.load_msa_from_cache(sequence), raw_msa_results
+                )
+
+                # Cache entries are separated by MSA backend
+                self.assertIsNone(
+                    gget_alphafold.load_msa_from_cache(sequence, "mmseqs2")
+                )
+
+                # A corrupt cache entry is treated as a miss
+                with open(gget_alphafold.msa_cache_path(sequence), "wb") as f:
+                    f.write(b"not a pickle")
+                self.assertIsNone(gget_alphafold.load_msa_from_cache(sequence))
+
     def test_n_colors(self):
         result_to_test = n_colors("A")
         expected_result = "\x1b[38;5;15m\x1b[48;5;9mA\x1b[0;0m"